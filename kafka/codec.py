@@ -4,13 +4,20 @@ import gzip
 import io
 import platform
 import struct
+import zlib
 
 from kafka.vendor import six
 from kafka.vendor.six.moves import range
 
 _XERIAL_V1_HEADER = (-126, b'S', b'N', b'A', b'P', b'P', b'Y', 0, 1, 1)
 _XERIAL_V1_FORMAT = 'bccccccBii'
+_XERIAL_V1_STRUCT = struct.Struct('!' + _XERIAL_V1_FORMAT)
+_XERIAL_BLOCK_SIZE_STRUCT = struct.Struct('!i')
 ZSTD_MAX_OUTPUT_SIZE = 1024 * 1024
+_GZIP_MAGIC = b'\x1f\x8b'
+# gzip.BadGzipFile is python 3.8+; older GzipFile raised a plain IOError
+_BadGzipFile = getattr(gzip, 'BadGzipFile', IOError)
+_ZLIB_HAS_EOF = hasattr(zlib.decompressobj(), 'eof')
 
 try:
     import snappy
@@ -95,7 +102,7 @@ def gzip_encode(payload, compresslevel=None):
     return buf.getvalue()
 
 
-def gzip_decode(payload):
+def _gzip_file_decode(payload):
     buf = io.BytesIO(payload)
 
     # Gzip context manager introduced in python 2.7
@@ -107,6 +114,31 @@ def gzip_decode(payload):
         gzipper.close()
 
 
+def gzip_decode(payload):
+    # python 2 decompressobj has no eof flag to detect truncation with
+    if not _ZLIB_HAS_EOF:
+        return _gzip_file_decode(payload)
+    # zlib parses the gzip container itself (wbits=16+MAX_WBITS), which
+    # skips the BytesIO/GzipFile wrappers. Like GzipFile, keep going over
+    # concatenated members, reject a truncated stream and report anything
+    # that is not gzip data as BadGzipFile.
+    chunks = []
+    while payload:
+        if bytes(payload[:2]) != _GZIP_MAGIC:
+            raise _BadGzipFile('Not a gzipped file (%r)' % (bytes(payload[:2]),))
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            chunks.append(decompressor.decompress(payload))
+        except zlib.error as e:
+            raise _BadGzipFile(str(e))
+        if not decompressor.eof:
+            raise EOFError("Compressed file ended before the "
+                           "end-of-stream marker was reached")
+        # GzipFile also tolerates zero padding after the last member
+        payload = decompressor.unused_data.lstrip(b'\x00')
+    return b''.join(chunks)
+
+
 def snappy_encode(payload, xerial_compatible=True, xerial_blocksize=32*1024):
     """Encodes the given data with snappy compression.
 
@@ -140,8 +172,7 @@ def snappy_encode(payload, xerial_compatible=True, xerial_blocksize=32*1024):
         return snappy.compress(payload)
 
     out = io.BytesIO()
-    for fmt, dat in zip(_XERIAL_V1_FORMAT, _XERIAL_V1_HEADER):
-        out.write(struct.pack('!' + fmt, dat))
+    out.write(_XERIAL_V1_STRUCT.pack(*_XERIAL_V1_HEADER))
 
     # Chunk through buffers to avoid creating intermediate slice copies
     if PYPY:
@@ -164,7 +195,7 @@ def snappy_encode(payload, xerial_compatible=True, xerial_blocksize=32*1024):
 
         block = snappy.compress(chunk)
         block_size = len(block)
-        out.write(struct.pack('!i', block_size))
+        out.write(_XERIAL_BLOCK_SIZE_STRUCT.pack(block_size))
         out.write(block)
 
     return out.getvalue()
@@ -193,7 +224,7 @@ def _detect_xerial_stream(payload):
     """
 
     if len(payload) > 16:
-        header = struct.unpack('!' + _XERIAL_V1_FORMAT, bytes(payload)[:16])
+        header = _XERIAL_V1_STRUCT.unpack_from(payload)
         return header == _XERIAL_V1_HEADER
     return False
 
@@ -203,22 +234,19 @@ def snappy_decode(payload):
         raise NotImplementedError("Snappy codec is not available")
 
     if _detect_xerial_stream(payload):
-        # TODO ? Should become a fileobj ?
-        out = io.BytesIO()
-        byt = payload[16:]
-        length = len(byt)
-        cursor = 0
+        blocks = []
+        length = len(payload)
+        cursor = 16  # Skip the xerial header
 
         while cursor < length:
-            block_size = struct.unpack_from('!i', byt[cursor:])[0]
+            block_size = _XERIAL_BLOCK_SIZE_STRUCT.unpack_from(payload, cursor)[0]
             # Skip the block size
             cursor += 4
             end = cursor + block_size
-            out.write(snappy.decompress(byt[cursor:end]))
+            blocks.append(snappy.decompress(payload[cursor:end]))
             cursor = end
 
-        out.seek(0)
-        return out.read()
+        return b''.join(blocks)
     else:
         return snappy.decompress(payload)
 
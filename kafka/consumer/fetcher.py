@@ -379,8 +379,7 @@ class Fetcher(six.Iterator):
                            " partition %s and update position to %s", position,
                            tp, next_offset)
 
-                for record in part_records:
-                    drained[tp].append(record)
+                drained[tp].extend(part_records)
 
                 if update_offsets:
                     self._subscriptions.assignment[tp].position = next_offset
@@ -453,6 +452,9 @@ class Fetcher(six.Iterator):
             self._next_partition_records = None
 
     def _unpack_message_set(self, tp, records):
+        # Records are collected straight into a list, which PartitionRecords
+        # needs anyway, instead of yielding through a generator first
+        unpacked = []
         try:
             batch = records.next_batch()
             while batch is not None:
@@ -477,19 +479,20 @@ class Fetcher(six.Iterator):
                     header_size = sum(
                         len(h_key.encode("utf-8")) + (len(h_val) if h_val is not None else 0) for h_key, h_val in
                         headers) if headers else -1
-                    yield ConsumerRecord(
+                    unpacked.append(ConsumerRecord(
                         tp.topic, tp.partition, record.offset, record.timestamp,
                         record.timestamp_type, key, value, headers, record.checksum,
-                        key_size, value_size, header_size)
+                        key_size, value_size, header_size))
 
                 batch = records.next_batch()
 
-        # If unpacking raises StopIteration, it is erroneously
-        # caught by the generator. We want all exceptions to be raised
+        # If unpacking raises StopIteration, it could be mistaken for the
+        # end of iteration by callers. We want all exceptions to be raised
         # back to the user. See Issue 545
         except StopIteration as e:
             log.exception('StopIteration raised unpacking messageset')
             raise RuntimeError('StopIteration raised unpacking messageset')
+        return unpacked
 
     def __iter__(self):  # pylint: disable=non-iterator-returned
         return self
@@ -715,11 +718,13 @@ class Fetcher(six.Iterator):
         requests = {}
         for node_id, partition_data in six.iteritems(fetchable):
             if version < 3:
+                # Encode topics and partitions in a deterministic (sorted) order
                 requests[node_id] = FetchRequest[version](
                     -1,  # replica_id
                     self.config['fetch_max_wait_ms'],
                     self.config['fetch_min_bytes'],
-                    partition_data.items())
+                    [(topic, sorted(partitions))
+                     for topic, partitions in sorted(partition_data.items())])
             else:
                 # As of version == 3 partitions will be returned in order as
                 # they are requested, so to avoid starvation with
@@ -815,7 +820,7 @@ class Fetcher(six.Iterator):
                     log.debug("Adding fetched record for partition %s with"
                               " offset %d to buffered record list", tp,
                               position)
-                    unpacked = list(self._unpack_message_set(tp, records))
+                    unpacked = self._unpack_message_set(tp, records)
                     parsed_records = self.PartitionRecords(fetch_offset, tp, unpacked)
                     if unpacked:
                         last_offset = unpacked[-1].offset
@@ -319,12 +319,13 @@ class Sender(threading.Thread):
             version = 1
         else:
             version = 0
+        # Encode topics and partitions in a deterministic (sorted) order
         return ProduceRequest[version](
             required_acks=acks,
             timeout=timeout,
-            topics=[(topic, list(partition_info.items()))
+            topics=[(topic, sorted(partition_info.items()))
                     for topic, partition_info
-                    in six.iteritems(produce_records_by_partition)],
+                    in sorted(produce_records_by_partition.items())],
             **kwargs
         )
 
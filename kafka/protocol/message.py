@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 
 import io
+import struct
 import time
 
 from kafka.codec import (has_gzip, has_snappy, has_lz4, has_zstd,
@@ -11,7 +12,7 @@ from kafka.protocol.struct import Struct
 from kafka.protocol.types import (
     Int8, Int32, Int64, Bytes, Schema, AbstractType
 )
-from kafka.util import crc32, WeakMethod
+from kafka.util import crc32
 
 
 class Message(Struct):
@@ -55,7 +56,6 @@ class Message(Struct):
         self.attributes = attributes
         self.key = key
         self.value = value
-        self.encode = WeakMethod(self._encode_self)
 
     @property
     def timestamp_type(self):
@@ -74,23 +74,25 @@ class Message(Struct):
     def _encode_self(self, recalc_crc=True):
         version = self.magic
         if version == 1:
-            fields = (self.crc, self.magic, self.attributes, self.timestamp, self.key, self.value)
+            fields = (self.magic, self.attributes, self.timestamp, self.key, self.value)
         elif version == 0:
-            fields = (self.crc, self.magic, self.attributes, self.key, self.value)
+            fields = (self.magic, self.attributes, self.key, self.value)
         else:
             raise ValueError('Unrecognized message version: %s' % (version,))
-        message = Message.SCHEMAS[version].encode(fields)
-        if not recalc_crc:
-            return message
-        self.crc = crc32(message[4:])
-        crc_field = self.SCHEMAS[version].fields[0]
-        return crc_field.encode(self.crc) + message[4:]
+        # Encode the crc-covered body on its own, so the checksum is taken
+        # over it directly and prepending the crc is the only copy
+        body_fields = Message.SCHEMAS[version].fields[1:]
+        body = b''.join([field.encode(fields[i])
+                         for i, field in enumerate(body_fields)])
+        if recalc_crc:
+            self.crc = crc32(body)
+        return Int32.encode(self.crc) + body
 
     @classmethod
     def decode(cls, data):
         _validated_crc = None
         if isinstance(data, bytes):
-            _validated_crc = crc32(data[4:])
+            _validated_crc = crc32(memoryview(data)[4:])
             data = io.BytesIO(data)
         # Partial decode required to determine message version
         base_fields = cls.SCHEMAS[0].fields[0:3]
@@ -110,7 +112,7 @@ class Message(Struct):
     def validate_crc(self):
         if self._validated_crc is None:
             raw_msg = self._encode_self(recalc_crc=False)
-            self._validated_crc = crc32(raw_msg[4:])
+            self._validated_crc = crc32(memoryview(raw_msg)[4:])
         if self.crc == self._validated_crc:
             return True
         return False
@@ -156,6 +158,7 @@ class MessageSet(AbstractType):
         ('message', Bytes)
     )
     HEADER_SIZE = 12  # offset + message_size
+    HEADER_STRUCT = struct.Struct('>qi')  # offset + message_size
 
     @classmethod
     def encode(cls, items, prepend_size=True):
@@ -168,15 +171,31 @@ class MessageSet(AbstractType):
                 size += 4
             return items.read(size)
 
-        encoded_values = []
-        for (offset, message) in items:
-            encoded_values.append(Int64.encode(offset))
-            encoded_values.append(Bytes.encode(message))
-        encoded = b''.join(encoded_values)
+        # Size the output once and write each item in place, rather than
+        # joining a pair of freshly packed bytes objects per message
+        if not isinstance(items, (list, tuple)):
+            items = list(items)
+        size = 0
+        for (_, message) in items:
+            size += cls.HEADER_SIZE
+            if message is not None:
+                size += len(message)
+        pos = 4 if prepend_size else 0
+        encoded = bytearray(pos + size)
         if prepend_size:
-            return Bytes.encode(encoded)
-        else:
-            return encoded
+            encoded[0:4] = Int32.encode(size)
+        pack_header = cls.HEADER_STRUCT.pack_into
+        for (offset, message) in items:
+            if message is None:
+                pack_header(encoded, pos, offset, -1)
+                pos += cls.HEADER_SIZE
+                continue
+            message_size = len(message)
+            pack_header(encoded, pos, offset, message_size)
+            pos += cls.HEADER_SIZE
+            encoded[pos:pos + message_size] = message
+            pos += message_size
+        return bytes(encoded)
 
     @classmethod
     def decode(cls, data, bytes_to_read=None):
@@ -191,15 +210,25 @@ class MessageSet(AbstractType):
         # if FetchRequest max_bytes is smaller than the available message set
         # the server returns partial data for the final message
         # So create an internal buffer to avoid over-reading
-        raw = io.BytesIO(data.read(bytes_to_read))
+        raw = data.read(bytes_to_read)
+        raw_len = len(raw)
+        unpack_header = cls.HEADER_STRUCT.unpack_from
 
         items = []
+        pos = 0
         while bytes_to_read:
             try:
-                offset = Int64.decode(raw)
-                msg_bytes = Bytes.decode(raw)
-                bytes_to_read -= 8 + 4 + len(msg_bytes)
-                items.append((offset, len(msg_bytes), Message.decode(msg_bytes)))
+                if pos + cls.HEADER_SIZE > raw_len:
+                    raise ValueError('Buffer underrun decoding MessageSet header')
+                offset, msg_size = unpack_header(raw, pos)
+                pos += cls.HEADER_SIZE
+                if msg_size < 0 or pos + msg_size > raw_len:
+                    raise ValueError('Buffer underrun decoding MessageSet message')
+                # Only the message itself is copied out of the read buffer
+                msg_bytes = raw[pos:pos + msg_size]
+                pos += msg_size
+                bytes_to_read -= cls.HEADER_SIZE + msg_size
+                items.append((offset, msg_size, Message.decode(msg_bytes)))
             except ValueError:
                 # PartialMessage to signal that max_bytes may be too small
                 items.append((None, None, PartialMessage()))
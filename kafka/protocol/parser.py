@@ -2,11 +2,12 @@ from __future__ import absolute_import
 
 import collections
 import logging
+import struct
 
 import kafka.errors as Errors
 from kafka.protocol.commit import GroupCoordinatorResponse
 from kafka.protocol.frame import KafkaBytes
-from kafka.protocol.types import Int32, TaggedFields
+from kafka.protocol.types import Int32, String, TaggedFields
 from kafka.version import __version__
 
 log = logging.getLogger(__name__)
@@ -24,10 +25,16 @@ class KafkaProtocol(object):
             Currently only used to check for 0.8.2 protocol quirks, but
             may be used for more in the future.
     """
+    # api_key, api_version and correlation_id lead every request header
+    REQUEST_HEADER_PREFIX = struct.Struct('>hhi')
+    EMPTY_TAGGED_FIELDS = TaggedFields.encode({})
+
     def __init__(self, client_id=None, api_version=None):
         if client_id is None:
             client_id = self._gen_client_id()
         self._client_id = client_id
+        # The client id is the same in every request header, so encode it once
+        self._encoded_client_id = String('utf-8').encode(client_id)
         self._api_version = api_version
         self._correlation_id = 0
         self._header = KafkaBytes(4)
@@ -59,16 +66,24 @@ class KafkaProtocol(object):
         if correlation_id is None:
             correlation_id = self._next_correlation_id()
 
-        header = request.build_request_header(correlation_id=correlation_id, client_id=self._client_id)
-        message = b''.join([header.encode(), request.encode()])
-        size = Int32.encode(len(message))
-        data = size + message
-        self.bytes_to_send.append(data)
+        header = self._encode_request_header(request, correlation_id)
+        message = request.encode()
+        size = Int32.encode(len(header) + len(message))
+        self.bytes_to_send.append(b''.join([size, header, message]))
         if request.expect_response():
             ifr = (correlation_id, request)
             self.in_flight_requests.append(ifr)
         return correlation_id
 
+    def _encode_request_header(self, request, correlation_id):
+        """Encode the same bytes as request.build_request_header().encode()
+        without building a header Struct or re-encoding the client id."""
+        prefix = self.REQUEST_HEADER_PREFIX.pack(
+            request.API_KEY, request.API_VERSION, correlation_id)
+        if request.FLEXIBLE_VERSION:
+            return b''.join([prefix, self._encoded_client_id, self.EMPTY_TAGGED_FIELDS])
+        return prefix + self._encoded_client_id
+
     def send_bytes(self):
         """Retrieve all pending bytes to send on the network"""
         data = b''.join(self.bytes_to_send)
@@ -5,7 +5,19 @@ from io import BytesIO
 from kafka.protocol.abstract import AbstractType
 from kafka.protocol.types import Schema
 
-from kafka.util import WeakMethod
+
+class _EncodeMethod(object):
+    """Dispatch encode() to the class or the instance it is accessed from.
+
+    Struct.encode(item) encodes a tuple of field values, while
+    instance.encode() encodes the instance itself. Resolving this on lookup
+    avoids storing a bound method (and the reference cycle it creates) on
+    every instance.
+    """
+    def __get__(self, instance, owner):
+        if instance is None:
+            return owner._encode_item
+        return instance._encode_self
 
 
 class Struct(AbstractType):
@@ -25,14 +37,11 @@ class Struct(AbstractType):
                                  % (list(self.SCHEMA.names),
                                     ', '.join(kwargs.keys())))
 
-        # overloading encode() to support both class and instance
-        # Without WeakMethod() this creates circular ref, which
-        # causes instances to "leak" to garbage
-        self.encode = WeakMethod(self._encode_self)
-
+    # encode() is supported on both class and instance
+    encode = _EncodeMethod()
 
     @classmethod
-    def encode(cls, item):  # pylint: disable=E0202
+    def _encode_item(cls, item):
         bits = []
         for i, field in enumerate(cls.SCHEMA.fields):
             bits.append(field.encode(item[i]))
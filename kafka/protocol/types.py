@@ -1,6 +1,8 @@
 from __future__ import absolute_import
 
+import array
 import struct
+import sys
 from struct import error
 
 from kafka.protocol.abstract import AbstractType
@@ -25,6 +27,27 @@ def _unpack(f, data):
                         .format(data, f, e))
 
 
+class BoundedCache(dict):
+    """Dict that fills missing keys with factory(key).
+
+    Once max_size entries are held the cache is emptied before the next
+    insert, so keys that are no longer used do not pin it full forever.
+    """
+    __slots__ = ('_factory', '_max_size')
+
+    def __init__(self, factory, max_size):
+        super(BoundedCache, self).__init__()
+        self._factory = factory
+        self._max_size = max_size
+
+    def __missing__(self, key):
+        value = self._factory(key)
+        if len(self) >= self._max_size:
+            self.clear()
+        self[key] = value
+        return value
+
+
 class Int8(AbstractType):
     _pack = struct.Struct('>b').pack
     _unpack = struct.Struct('>b').unpack
@@ -90,6 +113,19 @@ class Float64(AbstractType):
         return _unpack(cls._unpack, data.read(8))
 
 
+def _encode_string(cache_key):
+    value, encoding = cache_key
+    value = value.encode(encoding)
+    return Int16.encode(len(value)) + value
+
+
+# Client ids, topic and group names are re-encoded for nearly every request,
+# so short strings are cached with their length prefix, keyed by
+# (value, encoding)
+_ENCODED_STRINGS = BoundedCache(_encode_string, 1024)
+_ENCODED_STRING_MAX_LENGTH = 255
+
+
 class String(AbstractType):
     def __init__(self, encoding='utf-8'):
         self.encoding = encoding
@@ -97,8 +133,9 @@ class String(AbstractType):
     def encode(self, value):
         if value is None:
             return Int16.encode(-1)
-        value = str(value).encode(self.encoding)
-        return Int16.encode(len(value)) + value
+        if type(value) is str and len(value) <= _ENCODED_STRING_MAX_LENGTH:
+            return _ENCODED_STRINGS[(value, self.encoding)]
+        return _encode_string((str(value), self.encoding))
 
     def decode(self, data):
         length = Int16.decode(data)
@@ -181,6 +218,44 @@ class Schema(AbstractType):
             return repr(value)
 
 
+# Arrays of Int32 (replica ids, isr, partition ids) are decoded in bulk with
+# array.array when the platform C int is 4 bytes wide.
+_INT32_ARRAY_SUPPORTED = array.array('i').itemsize == 4
+_SWAP_BYTES = sys.byteorder == 'little'
+# array.frombytes is python 3 only; python 2 calls it fromstring
+_ARRAY_FROMBYTES = 'frombytes' if hasattr(array.array, 'frombytes') else 'fromstring'
+
+
+def _decode_int32_array(data, length):
+    raw = data.read(4 * length)
+    if len(raw) != 4 * length:
+        raise ValueError('Buffer underrun decoding Int32 array')
+    values = array.array('i')
+    getattr(values, _ARRAY_FROMBYTES)(raw)
+    if _SWAP_BYTES:
+        values.byteswap()
+    return values.tolist()
+
+
+# Compiled '>i%di' structs (length prefix + items) for encoding Int32 arrays,
+# keyed by item count
+_INT32_ARRAY_STRUCTS = BoundedCache(
+    lambda length: struct.Struct('>i%di' % (length,)), 256)
+
+
+def _encode_int32_array(items):
+    if not isinstance(items, (list, tuple)):
+        items = list(items)
+    length = len(items)
+    packer = _INT32_ARRAY_STRUCTS[length]
+    try:
+        return packer.pack(length, *items)
+    except error as e:
+        raise ValueError("Error encountered when attempting to convert value: "
+                        "{!r} to struct format: '{}', hit error: {}"
+                        .format(items, packer.format, e))
+
+
 class Array(AbstractType):
     def __init__(self, *array_of):
         if len(array_of) > 1:
@@ -194,6 +269,8 @@ class Array(AbstractType):
     def encode(self, items):
         if items is None:
             return Int32.encode(-1)
+        if self.array_of is Int32:
+            return _encode_int32_array(items)
         encoded_items = [self.array_of.encode(item) for item in items]
         return b''.join(
             [Int32.encode(len(encoded_items))] +
@@ -204,6 +281,8 @@ class Array(AbstractType):
         length = Int32.decode(data)
         if length == -1:
             return None
+        if self.array_of is Int32 and length > 0 and _INT32_ARRAY_SUPPORTED:
+            return _decode_int32_array(data, length)
         return [self.array_of.decode(data) for _ in range(length)]
 
     def repr(self, list_of_items):
@@ -212,12 +291,20 @@ class Array(AbstractType):
         return '[' + ', '.join([self.array_of.repr(item) for item in list_of_items]) + ']'
 
 
+def _read_byte(data):
+    # ord() of a single byte is cheaper than a struct round trip
+    b = data.read(1)
+    if not b:
+        raise ValueError('Buffer underrun decoding varint')
+    return ord(b)
+
+
 class UnsignedVarInt32(AbstractType):
     @classmethod
     def decode(cls, data):
         value, i = 0, 0
         while True:
-            b, = struct.unpack('B', data.read(1))
+            b = _read_byte(data)
             if not (b & 0x80):
                 break
             value |= (b & 0x7f) << i
@@ -230,13 +317,12 @@ class UnsignedVarInt32(AbstractType):
     @classmethod
     def encode(cls, value):
         value &= 0xffffffff
-        ret = b''
+        ret = bytearray()
         while (value & 0xffffff80) != 0:
-            b = (value & 0x7f) | 0x80
-            ret += struct.pack('B', b)
+            ret.append((value & 0x7f) | 0x80)
             value >>= 7
-        ret += struct.pack('B', value)
-        return ret
+        ret.append(value)
+        return bytes(ret)
 
 
 class VarInt32(AbstractType):
@@ -257,7 +343,7 @@ class VarInt64(AbstractType):
     def decode(cls, data):
         value, i = 0, 0
         while True:
-            b = data.read(1)
+            b = _read_byte(data)
             if not (b & 0x80):
                 break
             value |= (b & 0x7f) << i
@@ -269,16 +355,15 @@ class VarInt64(AbstractType):
 
     @classmethod
     def encode(cls, value):
-        # bring it in line with the java binary repr
-        value &= 0xffffffffffffffff
-        v = (value << 1) ^ (value >> 63)
-        ret = b''
+        # zigzag on the signed value, then bring it in line with the java
+        # binary repr
+        v = ((value << 1) ^ (value >> 63)) & 0xffffffffffffffff
+        ret = bytearray()
         while (v & 0xffffffffffffff80) != 0:
-            b = (value & 0x7f) | 0x80
-            ret += struct.pack('B', b)
+            ret.append((v & 0x7f) | 0x80)
             v >>= 7
-        ret += struct.pack('B', v)
-        return ret
+        ret.append(v)
+        return bytes(ret)
 
 
 class CompactString(String):
@@ -318,14 +403,14 @@ class TaggedFields(AbstractType):
 
     @classmethod
     def encode(cls, value):
-        ret = UnsignedVarInt32.encode(len(value))
+        ret = [UnsignedVarInt32.encode(len(value))]
         for k, v in value.items():
             # do we allow for other data types ?? It could get complicated really fast
             assert isinstance(v, bytes), 'Value {} is not a byte array'.format(v)
             assert isinstance(k, int) and k > 0, 'Key {} is not a positive integer'.format(k)
-            ret += UnsignedVarInt32.encode(k)
-            ret += v
-        return ret
+            ret.append(UnsignedVarInt32.encode(k))
+            ret.append(v)
+        return b''.join(ret)
 
 
 class CompactBytes(AbstractType):
@@ -105,14 +105,24 @@ def crc_update(crc, data):
     Returns:
         32-bit updated CRC-32C as long.
     """
-    if not isinstance(data, array.array) or data.itemsize != 1:
+    if isinstance(data, memoryview):
+        # array.array("B", memoryview) walks the view item by item;
+        # frombytes copies the whole buffer at once
+        buf = array.array("B")
+        if hasattr(buf, "frombytes"):
+            buf.frombytes(data)
+        else:
+            buf.fromstring(data.tobytes())
+    elif not isinstance(data, array.array) or data.itemsize != 1:
         buf = array.array("B", data)
     else:
         buf = data
-    crc = crc ^ _MASK
+    # Table entries and the shifted crc both fit in 32 bits, so there is
+    # no need to mask inside the loop; bind the table locally as well.
+    table = CRC_TABLE
+    crc = (crc ^ _MASK) & _MASK
     for b in buf:
-        table_index = (crc ^ b) & 0xff
-        crc = (CRC_TABLE[table_index] ^ (crc >> 8)) & _MASK
+        crc = table[(crc ^ b) & 0xff] ^ (crc >> 8)
     return crc ^ _MASK
 
 
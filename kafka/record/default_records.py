@@ -87,6 +87,7 @@ class DefaultRecordBase(object):
         "i"  # BaseSequence => Int32
         "i"  # Records count => Int32
     )
+    CRC_STRUCT = struct.Struct(">I")  # CRC => Uint32
     # Byte offset in HEADER_STRUCT of attributes field. Used to calculate CRC
     ATTRIBUTES_OFFSET = struct.calcsize(">qiibI")
     CRC_OFFSET = struct.calcsize(">qiib")
@@ -298,9 +299,13 @@ class DefaultRecordBatch(DefaultRecordBase, ABCRecordBatch):
         assert self._decompressed is False, \
             "Validate should be called before iteration"
 
+        # A batch whose length field disagrees with the buffer can not be
+        # valid, so skip hashing it
+        if self._header_data[1] != len(self._buffer) - self.AFTER_LEN_OFFSET:
+            return False
         crc = self.crc
         data_view = memoryview(self._buffer)[self.ATTRIBUTES_OFFSET:]
-        verify_crc = calc_crc32c(data_view.tobytes())
+        verify_crc = calc_crc32c(data_view)
         return crc == verify_crc
 
 
@@ -508,14 +513,16 @@ class DefaultRecordBatchBuilder(DefaultRecordBase, ABCRecordBatchBuilder):
             self._base_sequence,
             self._num_records
         )
-        crc = calc_crc32c(self._buffer[self.ATTRIBUTES_OFFSET:])
-        struct.pack_into(">I", self._buffer, self.CRC_OFFSET, crc)
+        crc_data = memoryview(self._buffer)[self.ATTRIBUTES_OFFSET:]
+        crc = calc_crc32c(crc_data)
+        self.CRC_STRUCT.pack_into(self._buffer, self.CRC_OFFSET, crc)
 
     def _maybe_compress(self):
         if self._compression_type != self.CODEC_NONE:
             self._assert_has_codec(self._compression_type)
             header_size = self.HEADER_STRUCT.size
-            data = bytes(self._buffer[header_size:])
+            # Slice through a memoryview so the records are copied only once
+            data = bytes(memoryview(self._buffer)[header_size:])
             if self._compression_type == self.CODEC_GZIP:
                 compressed = gzip_encode(data)
             elif self._compression_type == self.CODEC_SNAPPY:
@@ -99,6 +99,9 @@ class LegacyRecordBase(object):
         "i"   # Value length
     )
 
+    LENGTH_STRUCT = struct.Struct(">i")  # Key/Value length => Int32
+    CRC_STRUCT = struct.Struct(">I")  # CRC => Uint32
+
     KEY_OFFSET_V0 = HEADER_STRUCT_V0.size
     KEY_OFFSET_V1 = HEADER_STRUCT_V1.size
     KEY_LENGTH = VALUE_LENGTH = struct.calcsize(">i")  # Bytes length is Int32
@@ -171,11 +174,11 @@ class LegacyRecordBatch(ABCRecordBatch, LegacyRecordBase):
     def _decompress(self, key_offset):
         # Copy of `_read_key_value`, but uses memoryview
         pos = key_offset
-        key_size = struct.unpack_from(">i", self._buffer, pos)[0]
+        key_size = self.LENGTH_STRUCT.unpack_from(self._buffer, pos)[0]
         pos += self.KEY_LENGTH
         if key_size != -1:
             pos += key_size
-        value_size = struct.unpack_from(">i", self._buffer, pos)[0]
+        value_size = self.LENGTH_STRUCT.unpack_from(self._buffer, pos)[0]
         pos += self.VALUE_LENGTH
         if value_size == -1:
             raise CorruptRecordException("Value of compressed message is None")
@@ -216,7 +219,7 @@ class LegacyRecordBatch(ABCRecordBatch, LegacyRecordBase):
         return msgs
 
     def _read_key_value(self, pos):
-        key_size = struct.unpack_from(">i", self._buffer, pos)[0]
+        key_size = self.LENGTH_STRUCT.unpack_from(self._buffer, pos)[0]
         pos += self.KEY_LENGTH
         if key_size == -1:
             key = None
@@ -224,7 +227,7 @@ class LegacyRecordBatch(ABCRecordBatch, LegacyRecordBase):
             key = self._buffer[pos:pos + key_size].tobytes()
             pos += key_size
 
-        value_size = struct.unpack_from(">i", self._buffer, pos)[0]
+        value_size = self.LENGTH_STRUCT.unpack_from(self._buffer, pos)[0]
         pos += self.VALUE_LENGTH
         if value_size == -1:
             value = None
@@ -233,6 +236,11 @@ class LegacyRecordBatch(ABCRecordBatch, LegacyRecordBase):
         return key, value
 
     def __iter__(self):
+        return iter(self._read_records())
+
+    def _read_records(self):
+        # Records are built into a list in one pass rather than yielded from
+        # a generator, as callers always consume the whole batch anyway.
         if self._magic == 1:
             key_offset = self.KEY_OFFSET_V1
         else:
@@ -254,6 +262,7 @@ class LegacyRecordBatch(ABCRecordBatch, LegacyRecordBase):
             else:
                 absolute_base_offset = -1
 
+            records = []
             for header, msg_pos in headers:
                 offset, _, crc, _, attrs, timestamp = header
                 # There should only ever be a single layer of compression
@@ -271,14 +280,15 @@ class LegacyRecordBatch(ABCRecordBatch, LegacyRecordBase):
                     offset += absolute_base_offset
 
                 key, value = self._read_key_value(msg_pos + key_offset)
-                yield LegacyRecord(
+                records.append(LegacyRecord(
                     offset, timestamp, timestamp_type,
-                    key, value, crc)
+                    key, value, crc))
+            return records
         else:
             key, value = self._read_key_value(key_offset)
-            yield LegacyRecord(
+            return [LegacyRecord(
                 self._offset, self._timestamp, timestamp_type,
-                key, value, self._crc)
+                key, value, self._crc)]
 
 
 class LegacyRecord(ABCRecord):
@@ -349,33 +359,43 @@ class LegacyRecordBatchBuilder(ABCRecordBatchBuilder, LegacyRecordBase):
         self._batch_size = batch_size
         self._buffer = bytearray()
 
-    def append(self, offset, timestamp, key, value, headers=None):
+    def append(self, offset, timestamp, key, value, headers=None,
+               # Cache for LOAD_FAST opcodes
+               get_type=type, type_int=int, time_time=time.time,
+               byte_like=(bytes, bytearray, memoryview), len_func=len):
         """ Append message to batch.
         """
         assert not headers, "Headers not supported in v0/v1"
+        magic = self._magic
         # Check types
-        if type(offset) != int:
+        if get_type(offset) != type_int:
             raise TypeError(offset)
-        if self._magic == 0:
+        if magic == 0:
             timestamp = self.NO_TIMESTAMP
         elif timestamp is None:
-            timestamp = int(time.time() * 1000)
-        elif type(timestamp) != int:
+            timestamp = type_int(time_time() * 1000)
+        elif get_type(timestamp) != type_int:
             raise TypeError(
                 "`timestamp` should be int, but {} provided".format(
                     type(timestamp)))
-        if not (key is None or
-                isinstance(key, (bytes, bytearray, memoryview))):
+        if not (key is None or isinstance(key, byte_like)):
             raise TypeError(
                 "Not supported type for key: {}".format(type(key)))
-        if not (value is None or
-                isinstance(value, (bytes, bytearray, memoryview))):
+        if not (value is None or isinstance(value, byte_like)):
             raise TypeError(
                 "Not supported type for value: {}".format(type(value)))
 
-        # Check if we have room for another message
-        pos = len(self._buffer)
-        size = self.size_in_bytes(offset, timestamp, key, value)
+        # Check if we have room for another message. Same as
+        # `size_in_bytes`, but inlined as this is called for every record.
+        pos = len_func(self._buffer)
+        if magic == 0:
+            size = self.LOG_OVERHEAD + self.RECORD_OVERHEAD_V0
+        else:
+            size = self.LOG_OVERHEAD + self.RECORD_OVERHEAD_V1
+        if key is not None:
+            size += len_func(key)
+        if value is not None:
+            size += len_func(value)
         # We always allow at least one record to be appended
         if offset != 0 and pos + size >= self._batch_size:
             return None
@@ -401,21 +421,21 @@ class LegacyRecordBatchBuilder(ABCRecordBatchBuilder, LegacyRecordBase):
         pos += self.KEY_OFFSET_V0 if magic == 0 else self.KEY_OFFSET_V1
 
         if key is None:
-            struct.pack_into(">i", buf, pos, -1)
+            self.LENGTH_STRUCT.pack_into(buf, pos, -1)
             pos += self.KEY_LENGTH
         else:
             key_size = len(key)
-            struct.pack_into(">i", buf, pos, key_size)
+            self.LENGTH_STRUCT.pack_into(buf, pos, key_size)
             pos += self.KEY_LENGTH
             buf[pos: pos + key_size] = key
             pos += key_size
 
         if value is None:
-            struct.pack_into(">i", buf, pos, -1)
+            self.LENGTH_STRUCT.pack_into(buf, pos, -1)
             pos += self.VALUE_LENGTH
         else:
             value_size = len(value)
-            struct.pack_into(">i", buf, pos, value_size)
+            self.LENGTH_STRUCT.pack_into(buf, pos, value_size)
             pos += self.VALUE_LENGTH
             buf[pos: pos + value_size] = value
             pos += value_size
@@ -434,7 +454,7 @@ class LegacyRecordBatchBuilder(ABCRecordBatchBuilder, LegacyRecordBase):
         # Calculate CRC for msg
         crc_data = memoryview(buf)[start_pos + self.MAGIC_OFFSET:]
         crc = calc_crc32(crc_data)
-        struct.pack_into(">I", buf, start_pos + self.CRC_OFFSET, crc)
+        self.CRC_STRUCT.pack_into(buf, start_pos + self.CRC_OFFSET, crc)
         return crc
 
     def _maybe_compress(self):
@@ -33,6 +33,8 @@ class MemoryRecords(ABCRecords):
     LENGTH_OFFSET = struct.calcsize(">q")
     LOG_OVERHEAD = struct.calcsize(">qi")
     MAGIC_OFFSET = struct.calcsize(">qii")
+    LENGTH_STRUCT = struct.Struct(">i")
+    MAGIC_STRUCT = struct.Struct(">b")
 
     # Minimum space requirements for Record V0
     MIN_SLICE = LOG_OVERHEAD + LegacyRecordBatch.RECORD_OVERHEAD_V0
@@ -65,7 +67,8 @@ class MemoryRecords(ABCRecords):
 
     # NOTE: we cache offsets here as kwargs for a bit more speed, as cPython
     # will use LOAD_FAST opcode in this case
-    def _cache_next(self, len_offset=LENGTH_OFFSET, log_overhead=LOG_OVERHEAD):
+    def _cache_next(self, len_offset=LENGTH_OFFSET, log_overhead=LOG_OVERHEAD,
+                    _unpack_length=LENGTH_STRUCT.unpack_from):
         buffer = self._buffer
         buffer_len = len(buffer)
         pos = self._pos
@@ -76,8 +79,7 @@ class MemoryRecords(ABCRecords):
             self._next_slice = None
             return
 
-        length, = struct.unpack_from(
-            ">i", buffer, pos + len_offset)
+        length, = _unpack_length(buffer, pos + len_offset)
 
         slice_end = pos + log_overhead + length
         if slice_end > buffer_len:
@@ -94,7 +96,8 @@ class MemoryRecords(ABCRecords):
 
     # NOTE: same cache for LOAD_FAST as above
     def next_batch(self, _min_slice=MIN_SLICE,
-                   _magic_offset=MAGIC_OFFSET):
+                   _magic_offset=MAGIC_OFFSET,
+                   _unpack_magic=MAGIC_STRUCT.unpack_from):
         next_slice = self._next_slice
         if next_slice is None:
             return None
@@ -103,7 +106,7 @@ class MemoryRecords(ABCRecords):
                 "Record size is less than the minimum record overhead "
                 "({})".format(_min_slice - self.LOG_OVERHEAD))
         self._cache_next()
-        magic, = struct.unpack_from(">b", next_slice, _magic_offset)
+        magic, = _unpack_magic(next_slice, _magic_offset)
         if magic <= 1:
             return LegacyRecordBatch(next_slice, magic)
         else:
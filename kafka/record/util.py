@@ -1,10 +1,20 @@
 import binascii
+import warnings
 
 from kafka.record._crc32c import crc as crc32c_py
+google_crc32c_c = None
 try:
     from crc32c import crc32c as crc32c_c
 except ImportError:
     crc32c_c = None
+    # Only google-crc32c's C extension is worth using. Its package __init__
+    # warns when that extension is missing, so keep the warning quiet here.
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            from google_crc32c.cext import value as google_crc32c_c
+    except ImportError:
+        pass
 
 
 def encode_varint(value, write):
@@ -117,9 +127,16 @@ def decode_varint(buffer, pos=0):
             raise ValueError("Out of int64 range")
 
 
+def _crc32c_google(memview):
+    # google_crc32c.cext.value accepts bytes only, not memoryviews
+    return google_crc32c_c(bytes(memview))
+
+
 _crc32c = crc32c_py
 if crc32c_c is not None:
     _crc32c = crc32c_c
+elif google_crc32c_c is not None:
+    _crc32c = _crc32c_google
 
 
 def calc_crc32c(memview, _crc32c=_crc32c):
@@ -42,6 +42,24 @@ def test_read_write_serde_v2(compression_type):
         assert msg.headers == headers
 
 
+def test_validate_crc_v2():
+    builder = DefaultRecordBatchBuilder(
+        magic=2, compression_type=0, is_transactional=0,
+        producer_id=-1, producer_epoch=-1, base_sequence=-1,
+        batch_size=999999)
+    builder.append(0, timestamp=9999999, key=b"test", value=b"Super",
+                   headers=[])
+    buffer = builder.build()
+    assert DefaultRecordBatch(bytes(buffer)).validate_crc() is True
+
+    corrupted = bytearray(buffer)
+    corrupted[-1] ^= 0xff
+    assert DefaultRecordBatch(bytes(corrupted)).validate_crc() is False
+
+    # Length field does not match the buffer
+    assert DefaultRecordBatch(bytes(buffer[:-1])).validate_crc() is False
+
+
 def test_written_bytes_equals_size_in_bytes_v2():
     key = b"test"
     value = b"Super"
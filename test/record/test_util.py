@@ -1,4 +1,6 @@
+import importlib
 import struct
+import sys
 import pytest
 from kafka.record import util
 
@@ -75,6 +77,7 @@ def test_crc32c(crc32_func):
         return struct.pack(">I", crc)
     assert make_crc(b"") == b"\x00\x00\x00\x00"
     assert make_crc(b"a") == b"\xc1\xd0\x43\x30"
+    assert make_crc(memoryview(bytearray(b"xa"))[1:]) == b"\xc1\xd0\x43\x30"
 
     # Took from librdkafka testcase
     long_text = b"""\
@@ -94,3 +97,29 @@ def test_crc32c(crc32_func):
      misrepresented as being the original software.
   3. This notice may not be removed or altered from any source distribution."""
     assert make_crc(long_text) == b"\x7d\xcd\xe1\x13"
+
+
+def test_crc32c_google(monkeypatch):
+    cext = pytest.importorskip("google_crc32c.cext")
+    monkeypatch.setattr(util, "google_crc32c_c", cext.value)
+    assert util._crc32c_google(memoryview(b"")) == 0
+    assert util._crc32c_google(memoryview(b"a")) == 0xc1d04330
+
+
+@pytest.mark.parametrize("hidden, backend", [
+    (["crc32c"], "_crc32c_google"),
+    (["crc32c", "google_crc32c.cext"], "crc32c_py"),
+])
+def test_crc32c_backend_selection(monkeypatch, hidden, backend):
+    if backend == "_crc32c_google":
+        pytest.importorskip("google_crc32c.cext")
+    for name in hidden:
+        monkeypatch.setitem(sys.modules, name, None)
+    try:
+        importlib.reload(util)
+        assert util._crc32c is getattr(util, backend)
+        data = memoryview(b"kafka-python")
+        assert util.calc_crc32c(data) == util.crc32c_py(data)
+    finally:
+        monkeypatch.undo()
+        importlib.reload(util)
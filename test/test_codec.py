@@ -6,6 +6,7 @@ import struct
 import pytest
 from kafka.vendor.six.moves import range
 
+import kafka.codec
 from kafka.codec import (
     has_snappy, has_lz4, has_zstd,
     gzip_encode, gzip_decode,
@@ -25,6 +26,35 @@ def test_gzip():
         assert b1 == b2
 
 
+def test_gzip_decode_multiple_members():
+    b1 = random_string(100).encode('utf-8')
+    b2 = random_string(100).encode('utf-8')
+    assert gzip_decode(gzip_encode(b1) + gzip_encode(b2)) == b1 + b2
+
+
+def test_gzip_decode_truncated():
+    with pytest.raises(EOFError):
+        gzip_decode(gzip_encode(b'foo' * 100)[:-4])
+
+
+def test_gzip_decode_empty():
+    assert gzip_decode(b'') == b''
+
+
+def test_gzip_decode_trailing_garbage():
+    with pytest.raises(IOError):
+        gzip_decode(gzip_encode(b'foo') + b'bar')
+
+
+def test_gzip_decode_without_zlib_eof(monkeypatch):
+    # python 2 falls back to GzipFile
+    monkeypatch.setattr(kafka.codec, '_ZLIB_HAS_EOF', False)
+    b1 = random_string(100).encode('utf-8')
+    b2 = random_string(100).encode('utf-8')
+    assert gzip_decode(gzip_encode(b1) + gzip_encode(b2)) == b1 + b2
+    assert gzip_decode(b'') == b''
+
+
 @pytest.mark.skipif(not has_snappy(), reason="Snappy not available")
 def test_snappy():
     for i in range(1000):
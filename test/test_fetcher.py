@@ -99,6 +99,25 @@ def test_create_fetch_requests(fetcher, mocker, api_version, fetch_version):
     assert all([isinstance(r, FetchRequest[fetch_version]) for r in requests])
 
 
+@pytest.mark.parametrize("api_version", [(0, 10, 0), (0, 9), (0, 8)])
+def test_create_fetch_requests_sorted(client, mocker, api_version):
+    partitions = [TopicPartition('foo', 1), TopicPartition('bar', 0),
+                  TopicPartition('foo', 0)]
+    subscription_state = SubscriptionState()
+    subscription_state.assign_from_user(partitions)
+    for tp in partitions:
+        subscription_state.seek(tp, 0)
+    fetcher = Fetcher(client, subscription_state, Metrics(),
+                      api_version=api_version)
+    mocker.patch.object(fetcher, '_fetchable_partitions',
+                        return_value=partitions)
+    fetcher._client.in_flight_request_count.return_value = 0
+    (request,) = fetcher._create_fetch_requests().values()
+    assert [(topic, [p[0] for p in partition_info])
+            for topic, partition_info in request.topics] == \
+        [('bar', [0]), ('foo', [0, 1])]
+
+
 def test_update_fetch_positions(fetcher, topic, mocker):
     mocker.patch.object(fetcher, '_reset_offset')
     partition = TopicPartition(topic, 0)
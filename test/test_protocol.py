@@ -4,12 +4,15 @@ import struct
 
 import pytest
 
+from kafka.protocol.admin import AlterPartitionReassignmentsRequest
 from kafka.protocol.api import RequestHeader
 from kafka.protocol.commit import GroupCoordinatorRequest
 from kafka.protocol.fetch import FetchRequest, FetchResponse
 from kafka.protocol.message import Message, MessageSet, PartialMessage
 from kafka.protocol.metadata import MetadataRequest
-from kafka.protocol.types import Int16, Int32, Int64, String, UnsignedVarInt32, CompactString, CompactArray, CompactBytes
+from kafka.protocol.parser import KafkaProtocol
+from kafka.protocol.types import BoundedCache, Array, Int16, Int32, Int64, String, UnsignedVarInt32, VarInt64, CompactString, CompactArray, CompactBytes
+from kafka.record.util import encode_varint
 
 
 def test_create_message():
@@ -51,6 +54,20 @@ def test_encode_message_v1():
     assert encoded == expect
 
 
+def test_encode_message_small_and_large_payloads():
+    for key, value in [(b'', b''), (None, b'test'), (b'key', None),
+                       (b'k' * 64, b'v' * 64), (b'k' * 65, b'v' * 100)]:
+        for magic in (0, 1):
+            timestamp = 1234 if magic else None
+            message = Message(value, key=key, magic=magic, timestamp=timestamp)
+            encoded = message.encode()
+            fields = [message.crc, magic, 0, key, value]
+            if magic:
+                fields.insert(3, timestamp)
+            assert encoded == Message.SCHEMAS[magic].encode(fields)
+            assert Message.decode(encoded).validate_crc()
+
+
 def test_decode_message():
     encoded = b''.join([
         struct.pack('>i', -1427009701), # CRC
@@ -120,6 +137,19 @@ def test_encode_message_set():
     assert encoded == expect
 
 
+def test_encode_message_set_without_size():
+    encoded = MessageSet.encode(iter([(0, b'abc'), (1, None)]),
+                                prepend_size=False)
+    expect = b''.join([
+        struct.pack('>q', 0),          # MsgSet Offset
+        struct.pack('>i', 3),          # Msg Size
+        b'abc',                        # Msg
+        struct.pack('>q', 1),          # MsgSet Offset
+        struct.pack('>i', -1),         # Null Msg
+    ])
+    assert encoded == expect
+
+
 def test_decode_message_set():
     encoded = b''.join([
         struct.pack('>q', 0),          # MsgSet Offset
@@ -173,6 +203,17 @@ def test_encode_message_header():
     assert header.encode() == expect
 
 
+def test_send_request_header_encoding():
+    protocol = KafkaProtocol(client_id='client3')
+    for req in (MetadataRequest[0](['foo']),
+                AlterPartitionReassignmentsRequest[0](timeout_ms=100, topics=[], tags={})):
+        correlation_id = protocol.send_request(req)
+        header = req.build_request_header(correlation_id=correlation_id,
+                                          client_id='client3')
+        message = header.encode() + req.encode()
+        assert protocol.send_bytes() == Int32.encode(len(message)) + message
+
+
 def test_decode_message_set_partial():
     encoded = b''.join([
         struct.pack('>q', 0),          # Msg Offset
@@ -306,6 +347,17 @@ def test_unsigned_varint_serde():
         assert value == UnsignedVarInt32.decode(io.BytesIO(encoded))
 
 
+@pytest.mark.parametrize("value", [
+    0, 1, -1, 63, -64, 300, -300, 2 ** 31, 2 ** 63 - 1, -2 ** 63,
+])
+def test_varint64_serde(value):
+    expected = bytearray()
+    encode_varint(value, expected.append)
+    encoded = VarInt64.encode(value)
+    assert encoded == bytes(expected)
+    assert VarInt64.decode(io.BytesIO(encoded)) == value
+
+
 def test_compact_data_structs():
     cs = CompactString()
     encoded = cs.encode(None)
@@ -334,3 +386,41 @@ def test_compact_data_structs():
     assert CompactBytes.decode(io.BytesIO(b'\x01')) is b''
     enc = CompactBytes.encode(b'foo')
     assert CompactBytes.decode(io.BytesIO(enc)) == b'foo'
+
+
+def test_int32_array_serde():
+    arr = Array(Int32)
+    values = [0, 1, -1, 2 ** 31 - 1, -2 ** 31]
+    encoded = arr.encode(values)
+    assert encoded == struct.pack('>i5i', 5, *values)
+    assert arr.decode(io.BytesIO(encoded)) == values
+    assert arr.decode(io.BytesIO(arr.encode([]))) == []
+    assert arr.decode(io.BytesIO(arr.encode(None))) is None
+    with pytest.raises(ValueError):
+        arr.decode(io.BytesIO(encoded[:-1]))
+
+
+def test_string_serde():
+    s = String('utf-8')
+    for value in ('', 'foo', 'fóó', 'x' * 1000):
+        encoded = s.encode(value)
+        assert encoded == s.encode(value)
+        assert encoded == Int16.encode(len(value.encode('utf-8'))) + value.encode('utf-8')
+        assert s.decode(io.BytesIO(encoded)) == value
+    assert s.encode(None) == Int16.encode(-1)
+    assert String('latin-1').encode('fóó') == Int16.encode(3) + 'fóó'.encode('latin-1')
+
+
+def test_bounded_cache():
+    calls = []
+    cache = BoundedCache(lambda key: calls.append(key) or key * 2, 2)
+    assert cache[1] == 2
+    assert cache[1] == 2
+    assert calls == [1]
+    cache[2]
+    assert len(cache) == 2
+    # A full cache is emptied, not frozen, so new keys are still cached
+    assert cache[3] == 6
+    assert list(cache) == [3]
+    cache[3]
+    assert calls == [1, 2, 3]
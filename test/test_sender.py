@@ -51,3 +51,18 @@ def test_produce_request(sender, mocker, api_version, produce_version):
     records.close()
     produce_request = sender._produce_request(0, 0, 0, [batch])
     assert isinstance(produce_request, ProduceRequest[produce_version])
+
+
+def test_produce_request_sorted(sender):
+    sender.config['api_version'] = (0, 10)
+    batches = []
+    for tp in (TopicPartition('foo', 1), TopicPartition('bar', 0),
+               TopicPartition('foo', 0)):
+        records = MemoryRecordsBuilder(
+            magic=1, compression_type=0, batch_size=100000)
+        batches.append(ProducerBatch(tp, records, io.BytesIO()))
+        records.close()
+    produce_request = sender._produce_request(0, 0, 0, batches)
+    assert [(topic, [p for p, _ in partitions])
+            for topic, partitions in produce_request.topics] == \
+        [('bar', [0]), ('foo', [0, 1])]